@@ -8,9 +8,9 @@ from pathlib import Path
 from datetime import datetime, date, timedelta
 
 # Import modules
-from modules.config_manager import ConfigManager
+from modules.config_manager import load_config
 from modules.news_fetcher import fetch_all_news_articles
-from modules.odds_fetcher import OddsFetcher
+from modules.odds_fetcher import OddsFetchError, fetch_nfl_week_games
 from modules.ui_components import UIComponents
 from modules.theme_manager import ThemeManager
 
@@ -26,9 +26,6 @@ st.set_page_config(
 )
 
 # Initialize session state
-if 'theme_mode' not in st.session_state:
-    st.session_state.theme_mode = 'dark'
-
 if 'active_tab' not in st.session_state:
     st.session_state.active_tab = 'News'
 
@@ -36,8 +33,7 @@ if 'active_tab' not in st.session_state:
 # LOAD CONFIGURATION
 # =============================================================================
 
-config_manager = ConfigManager()
-CONFIG = config_manager.load_config()
+CONFIG = load_config()
 APP_SETTINGS = CONFIG.get('app', {})
 
 # =============================================================================
@@ -72,6 +68,17 @@ def main():
     with tab2:
         render_odds_tab(ui)
 
+def get_team_positions(df) -> dict:
+    """Row positions per team, computed once per fetched DataFrame and kept in session state"""
+    cached = st.session_state.get('_team_positions')
+    fetched_at = df.attrs.get('fetched_at')
+    
+    if cached is None or cached[0] != fetched_at:
+        cached = (fetched_at, df.groupby('team', observed=True).indices)
+        st.session_state['_team_positions'] = cached
+    
+    return cached[1]
+
 def render_news_tab(ui: UIComponents):
     """Render the NFL News tab"""
     
@@ -95,7 +102,7 @@ def render_news_tab(ui: UIComponents):
         st.markdown('<div class="filter-label">Filter by Team</div>', unsafe_allow_html=True)
         selected_team = st.selectbox(
             'Team',
-            ['All Teams'] + sorted(df['team'].unique().tolist()),
+            ['All Teams'] + df['team'].cat.categories.tolist(),
             label_visibility="collapsed",
             key='team_filter'
         )
@@ -109,15 +116,15 @@ def render_news_tab(ui: UIComponents):
             key='sort_filter'
         )
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters (boolean indexing and sorting return new frames, so the cached df is never mutated)
+    filtered_df = df
     
     if selected_team != 'All Teams':
-        filtered_df = filtered_df[filtered_df['team'] == selected_team]
+        filtered_df = filtered_df.iloc[get_team_positions(df)[selected_team]]
     
-    # Apply sorting
+    # Apply sorting (df is cached newest-first, so oldest-first is just the reverse)
     if sort_order == 'Oldest First':
-        filtered_df = filtered_df.sort_values('date', ascending=True)
+        filtered_df = filtered_df.iloc[::-1]
     
     # Display article count
     st.markdown(
@@ -130,8 +137,7 @@ def render_news_tab(ui: UIComponents):
     if filtered_df.empty:
         st.info("No articles match your filter criteria.")
     else:
-        for _, row in filtered_df.iterrows():
-            ui.render_news_article(row)
+        ui.render_news_articles(filtered_df)
 
 def render_odds_tab(ui: UIComponents):
     """Render the Betting Odds tab"""
@@ -141,14 +147,8 @@ def render_odds_tab(ui: UIComponents):
     # Try to get API key from secrets first, then fall back to user input
     secret_api_key = st.secrets.get("ODDS_API_KEY", "")
     
-    # Check if we need to fetch (once per day)
-    from datetime import datetime, date
-    today = date.today()
-    last_fetch_date = st.session_state.get('odds_last_fetch_date')
-    needs_fetch = last_fetch_date != today
-    
     # API Key configuration
-    col1, col2, col3 = st.columns([2, 1, 1])
+    col1, col2 = st.columns([3, 1])
     
     with col1:
         if secret_api_key:
@@ -164,14 +164,7 @@ def render_odds_tab(ui: UIComponents):
     
     with col2:
         st.markdown("<div style='margin-top: 1.8rem;'></div>", unsafe_allow_html=True)
-        if last_fetch_date:
-            st.info(f"📅 Last updated: {last_fetch_date}")
-        else:
-            st.info("📅 Not fetched today")
-    
-    with col3:
-        st.markdown("<div style='margin-top: 1.8rem;'></div>", unsafe_allow_html=True)
-        fetch_button = st.button("🔄 Fetch Odds", use_container_width=True, disabled=not needs_fetch)
+        st.info("📅 Odds refresh once per day")
     
     if not api_key:
         st.info("👆 Enter your API key from [the-odds-api.com](https://the-odds-api.com) to view betting odds.")
@@ -192,21 +185,16 @@ def render_odds_tab(ui: UIComponents):
         """, unsafe_allow_html=True)
         return
     
-    # Auto-fetch on first load or when button clicked
-    if (fetch_button or 'odds_data' not in st.session_state) and needs_fetch:
+    # Shared across sessions and keyed on the UTC date, so odds refresh with the calendar day
+    try:
         with st.spinner('📡 Fetching betting odds...'):
-            odds_fetcher = OddsFetcher(api_key)
-            games = odds_fetcher.get_nfl_week_games()
-            st.session_state.odds_data = games
-            st.session_state.odds_last_fetch_date = today
-            st.success(f"✅ Odds updated! Next update available: {date.today() + timedelta(days=1)}")
-    elif not needs_fetch:
-        st.info("ℹ️ Odds already fetched today. Come back tomorrow for fresh data!")
-    
-    games = st.session_state.get('odds_data', [])
-    
-    if not games:
-        st.warning("⚠️ No games found for this week (Thu-Mon), or there was an error fetching data.")
+            games = fetch_nfl_week_games(api_key, datetime.utcnow().date())
+    except OddsFetchError as e:
+        st.error(f"❌ {e}")
+        return
+    
+    if len(games) == 0:
+        st.warning("⚠️ No games found for this week (Thu-Mon).")
         return
     
     # Display odds metrics
@@ -215,8 +203,7 @@ def render_odds_tab(ui: UIComponents):
     # Display games
     st.markdown('<div class="section-title">🎲 Game Odds</div>', unsafe_allow_html=True)
     
-    for game in games:
-        ui.render_game_card(game)
+    ui.render_game_cards(games)
 
 if __name__ == "__main__":
     main()
@@ -3,18 +3,20 @@ NFL News & Odds Aggregator - Modules Package
 Modular components for the Streamlit application
 """
 
-from .config_manager import ConfigManager
+from .config_manager import load_config
 from .news_fetcher import RSSFeedFetcher, NewsDataProcessor, fetch_all_news_articles
-from .odds_fetcher import OddsFetcher
+from .odds_fetcher import OddsFetcher, OddsFetchError, fetch_nfl_week_games
 from .theme_manager import ThemeManager
 from .ui_components import UIComponents
 
 __all__ = [
-    'ConfigManager',
+    'load_config',
     'RSSFeedFetcher',
     'NewsDataProcessor',
     'fetch_all_news_articles',
     'OddsFetcher',
+    'OddsFetchError',
+    'fetch_nfl_week_games',
     'ThemeManager',
     'UIComponents'
 ]
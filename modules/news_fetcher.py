@@ -3,17 +3,30 @@ News Fetcher Module
 Handles RSS feed fetching and processing for NFL news
 """
 
+import asyncio
+import os
+import aiohttp
 import feedparser
+import numpy as np
 import pandas as pd
-import hashlib
 import re
-import time
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.utils import parsedate_to_datetime
-import pytz
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Per-URL ETag / Last-Modified validators and last parsed articles, shared across reruns
+_FEED_CACHE: Dict[str, Dict] = {}
 
 class RSSFeedFetcher:
     """Handles RSS feed fetching with robust error handling and parallel processing"""
@@ -21,7 +34,11 @@ class RSSFeedFetcher:
     def __init__(self, days_lookback: int = 7, max_entries: int = 100):
         self.days_lookback = days_lookback
         self.max_entries = max_entries
-        self.cutoff_date = datetime.now() - timedelta(days=days_lookback)
+        self._utc = timezone.utc
+        self._est = ZoneInfo('America/New_York')
+        # Cutoff kept timezone-aware so stale entries are rejected before any EST conversion
+        self.cutoff_date = datetime.now(self._utc) - timedelta(days=days_lookback)
+        self.cutoff_date_est = self.cutoff_date.astimezone(self._est).replace(tzinfo=None)
         self.successful_fetches = 0
         self.failed_fetches = 0
     
@@ -29,27 +46,25 @@ class RSSFeedFetcher:
         """Remove HTML tags and clean text content"""
         if not text:
             return ""
-        text = re.sub(r'<[^>]+>', '', text)
-        text = ' '.join(text.split())
+        text = _TAG_RE.sub('', text)
+        text = _WS_RE.sub(' ', text).strip()
         if len(text) > 300:
             text = text[:300] + '...'
         return text
     
     def fetch_feed(self, url: str, source_name: str = "") -> List[Dict]:
         """Fetch a single RSS feed with comprehensive error handling"""
+        return self.parse_feed(url, source_name)
+    
+    def parse_feed(self, source, source_name: str = "") -> List[Dict]:
+        """Parse a feed from a URL or an already-downloaded body into article dicts"""
         try:
-            feed = feedparser.parse(url, request_headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            feed = feedparser.parse(source, request_headers=_REQUEST_HEADERS)
             
             if not feed.entries:
                 self.failed_fetches += 1
                 return []
             
-            # Define EST timezone
-            est = pytz.timezone('US/Eastern')
-            utc = pytz.UTC
-            
             articles = []
             for entry in feed.entries[:self.max_entries]:
                 title = entry.get('title', '').strip()
@@ -66,8 +81,8 @@ class RSSFeedFetcher:
                 
                 if pub_parsed:
                     try:
-                        # Convert struct_time to UTC datetime
-                        pub_date = datetime.fromtimestamp(time.mktime(pub_parsed), tz=utc)
+                        # feedparser normalizes struct_time to UTC, so build the datetime directly
+                        pub_date = datetime(*pub_parsed[:6], tzinfo=self._utc)
                     except (ValueError, OverflowError, OSError):
                         pass
                 
@@ -80,22 +95,19 @@ class RSSFeedFetcher:
                                 pub_date = parsedate_to_datetime(date_str)
                                 # If timezone-naive, assume UTC
                                 if pub_date.tzinfo is None:
-                                    pub_date = utc.localize(pub_date)
+                                    pub_date = pub_date.replace(tzinfo=self._utc)
                                 break
                             except:
                                 pass
                 
                 # Fall back to current time in UTC if all parsing failed
                 if pub_date is None:
-                    pub_date = datetime.now(utc)
-                
-                # Convert to EST
-                pub_date_est = pub_date.astimezone(est)
+                    pub_date = datetime.now(self._utc)
                 
-                # Make timezone-naive for storage and comparison
-                pub_date_naive = pub_date_est.replace(tzinfo=None)
-                
-                if pub_date_naive >= self.cutoff_date:
+                if pub_date >= self.cutoff_date:
+                    # Convert to EST and make timezone-naive for storage
+                    pub_date_naive = pub_date.astimezone(self._est).replace(tzinfo=None)
+                    
                     summary = entry.get('summary', entry.get('description', ''))
                     summary = self.sanitize_html_content(summary)
                     
@@ -114,30 +126,129 @@ class RSSFeedFetcher:
             self.failed_fetches += 1
             return []
     
+    @staticmethod
+    async def _fetch_bytes(session: aiohttp.ClientSession, url: str) -> Optional[Tuple[int, bytes, Dict]]:
+        """Conditionally download a single feed, returning None on any network error"""
+        headers = {}
+        cached = _FEED_CACHE.get(url)
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['modified']:
+                headers['If-Modified-Since'] = cached['modified']
+        
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return 304, b'', {}
+                response.raise_for_status()
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'modified': response.headers.get('Last-Modified')
+                }
+                return response.status, await response.read(), validators
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+    
+    async def _fetch_all_bytes(self, urls: List[str]) -> List[Optional[Tuple[int, bytes, Dict]]]:
+        """Download all feed bodies concurrently on a single event loop"""
+        timeout = aiohttp.ClientTimeout(total=15)
+        async with aiohttp.ClientSession(headers=_REQUEST_HEADERS, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *[self._fetch_bytes(session, url) for url in urls],
+                return_exceptions=True
+            )
+        
+        # Any unexpected error only fails its own feed
+        return [None if isinstance(result, BaseException) else result for result in results]
+    
     def fetch_multiple_feeds(self, feeds: List[Tuple[str, str]], max_workers: int = 10) -> List[Dict]:
-        """Fetch multiple RSS feeds in parallel for improved performance"""
+        """Fetch multiple RSS feeds concurrently, then parse the bodies on a small thread pool"""
         articles = []
+        if not feeds:
+            return articles
+        
+        responses = asyncio.run(self._fetch_all_bytes([url for url, _ in feeds]))
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(self.fetch_feed, url, name): (url, name)
-                      for url, name in feeds}
+        self.failed_fetches += responses.count(None)
+        
+        # Unchanged feeds (304) reuse their last parsed articles, minus anything now past the cutoff
+        to_parse = []
+        for response, (url, name) in zip(responses, feeds):
+            if response is None:
+                continue
+            status, body, validators = response
+            if status == 304:
+                articles.extend(
+                    article for article in _FEED_CACHE[url]['articles']
+                    if article['published'] >= self.cutoff_date_est
+                )
+                self.successful_fetches += 1
+            else:
+                to_parse.append((url, name, body, validators))
+        
+        parse_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=parse_workers) as executor:
+            futures = {executor.submit(self.parse_feed, body, name): (url, validators)
+                      for url, name, body, validators in to_parse}
             
             for future in as_completed(futures):
                 try:
-                    articles.extend(future.result())
+                    feed_articles = future.result()
                 except:
-                    pass
+                    continue
+                
+                url, validators = futures[future]
+                if feed_articles and (validators['etag'] or validators['modified']):
+                    _FEED_CACHE[url] = {**validators, 'articles': feed_articles}
+                articles.extend(feed_articles)
         
         return articles
 
-
 class NewsDataProcessor:
     """Utilities for processing and cleaning news data"""
     
-    @staticmethod
-    def generate_content_hash(text: str) -> str:
-        """Generate MD5 hash for content deduplication"""
-        return hashlib.md5(text.encode()).hexdigest()
+    # Built once per process and read-only, shared by the vectorized and scalar paths
+    TEAM_KEYWORD_MAPPING = MappingProxyType({
+        'CARDINALS': 'Arizona Cardinals',
+        'FALCONS': 'Atlanta Falcons',
+        'RAVENS': 'Baltimore Ravens',
+        'BILLS': 'Buffalo Bills',
+        'PANTHERS': 'Carolina Panthers',
+        'BEARS': 'Chicago Bears',
+        'BENGALS': 'Cincinnati Bengals',
+        'BROWNS': 'Cleveland Browns',
+        'COWBOYS': 'Dallas Cowboys',
+        'BRONCOS': 'Denver Broncos',
+        'LIONS': 'Detroit Lions',
+        'PACKERS': 'Green Bay Packers',
+        'TEXANS': 'Houston Texans',
+        'COLTS': 'Indianapolis Colts',
+        'JAGUARS': 'Jacksonville Jaguars',
+        'CHIEFS': 'Kansas City Chiefs',
+        'RAIDERS': 'Las Vegas Raiders',
+        'CHARGERS': 'Los Angeles Chargers',
+        'RAMS': 'Los Angeles Rams',
+        'DOLPHINS': 'Miami Dolphins',
+        'VIKINGS': 'Minnesota Vikings',
+        'PATRIOTS': 'New England Patriots',
+        'SAINTS': 'New Orleans Saints',
+        'GIANTS': 'New York Giants',
+        'JETS': 'New York Jets',
+        'EAGLES': 'Philadelphia Eagles',
+        'STEELERS': 'Pittsburgh Steelers',
+        '49ERS': 'San Francisco 49ers',
+        'SEAHAWKS': 'Seattle Seahawks',
+        'BUCCANEERS': 'Tampa Bay Buccaneers',
+        'BUCS': 'Tampa Bay Buccaneers',
+        'TITANS': 'Tennessee Titans',
+        'COMMANDERS': 'Washington Commanders'
+    })
+    
+    # Single alternation, longest keyword first so BUCCANEERS wins over BUCS
+    TEAM_KEYWORD_PATTERN = re.compile(
+        r'\b(' + '|'.join(map(re.escape, sorted(TEAM_KEYWORD_MAPPING, key=len, reverse=True))) + r')\b'
+    )
     
     @staticmethod
     def remove_duplicate_articles(df: pd.DataFrame) -> pd.DataFrame:
@@ -145,55 +256,34 @@ class NewsDataProcessor:
         if df.empty:
             return df
         
-        df['content_hash'] = df['headline'].apply(NewsDataProcessor.generate_content_hash)
-        df = df.drop_duplicates(subset=['content_hash']).drop(columns=['content_hash'])
-        
-        return df
+        return df.drop_duplicates(subset=['headline'], keep='first')
+    
+    @staticmethod
+    def identify_teams(headlines: pd.Series) -> pd.Series:
+        """Vectorized team detection over a column of headlines"""
+        keywords = headlines.str.upper().str.extract(NewsDataProcessor.TEAM_KEYWORD_PATTERN, expand=False)
+        return keywords.map(NewsDataProcessor.TEAM_KEYWORD_MAPPING).fillna('NFL General')
+    
+    @staticmethod
+    def add_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Add display-ready date and summary HTML columns in one vectorized pass"""
+        return df.assign(
+            date_str=df['date'].dt.strftime('%b %d, %Y %I:%M %p EST'),
+            summary_html=np.where(
+                df['summary'].str.len() > 0,
+                "<div class='article-summary'>" + df['summary'] + "</div>",
+                ""
+            )
+        )
     
     @staticmethod
     def identify_team_from_content(text: str, teams: List[str]) -> str:
-        """Extract NFL team name from article content using keyword matching"""
+        """Extract NFL team name from a single piece of text (scalar fallback)"""
         text_upper = text.upper()
         
-        team_keyword_mapping = {
-            'CARDINALS': 'Arizona Cardinals',
-            'FALCONS': 'Atlanta Falcons',
-            'RAVENS': 'Baltimore Ravens',
-            'BILLS': 'Buffalo Bills',
-            'PANTHERS': 'Carolina Panthers',
-            'BEARS': 'Chicago Bears',
-            'BENGALS': 'Cincinnati Bengals',
-            'BROWNS': 'Cleveland Browns',
-            'COWBOYS': 'Dallas Cowboys',
-            'BRONCOS': 'Denver Broncos',
-            'LIONS': 'Detroit Lions',
-            'PACKERS': 'Green Bay Packers',
-            'TEXANS': 'Houston Texans',
-            'COLTS': 'Indianapolis Colts',
-            'JAGUARS': 'Jacksonville Jaguars',
-            'CHIEFS': 'Kansas City Chiefs',
-            'RAIDERS': 'Las Vegas Raiders',
-            'CHARGERS': 'Los Angeles Chargers',
-            'RAMS': 'Los Angeles Rams',
-            'DOLPHINS': 'Miami Dolphins',
-            'VIKINGS': 'Minnesota Vikings',
-            'PATRIOTS': 'New England Patriots',
-            'SAINTS': 'New Orleans Saints',
-            'GIANTS': 'New York Giants',
-            'JETS': 'New York Jets',
-            'EAGLES': 'Philadelphia Eagles',
-            'STEELERS': 'Pittsburgh Steelers',
-            '49ERS': 'San Francisco 49ers',
-            'SEAHAWKS': 'Seattle Seahawks',
-            'BUCCANEERS': 'Tampa Bay Buccaneers',
-            'BUCS': 'Tampa Bay Buccaneers',
-            'TITANS': 'Tennessee Titans',
-            'COMMANDERS': 'Washington Commanders'
-        }
-        
-        for keyword, team in team_keyword_mapping.items():
-            if keyword in text_upper:
-                return team
+        match = NewsDataProcessor.TEAM_KEYWORD_PATTERN.search(text_upper)
+        if match:
+            return NewsDataProcessor.TEAM_KEYWORD_MAPPING[match.group(1)]
         
         for team in teams:
             if team.upper() in text_upper:
@@ -207,11 +297,12 @@ def fetch_all_news_articles(config: Dict) -> pd.DataFrame:
     """Fetch and process all news articles from configured RSS feeds"""
     
     APP_SETTINGS = config.get('app', {})
-    NFL_TEAMS = config.get('teams', [])
     RSS_FEED_SOURCES = config.get('rss_feeds', {})
     
     fetcher = RSSFeedFetcher(days_lookback=APP_SETTINGS.get('days_lookback', 7))
-    news_items = []
+    
+    # Columns are collected directly rather than as per-article row dicts
+    teams, headlines, links, dates, sources, summaries = [], [], [], [], [], []
     
     # Fetch from general NFL news sources
     general_feeds = [
@@ -223,39 +314,63 @@ def fetch_all_news_articles(config: Dict) -> pd.DataFrame:
     if general_feeds:
         articles = fetcher.fetch_multiple_feeds(general_feeds, max_workers=APP_SETTINGS.get('max_workers', 10))
         
+        # Team is tagged column-wise once the DataFrame is built
         for article in articles:
-            team = NewsDataProcessor.identify_team_from_content(article['title'], NFL_TEAMS)
-            news_items.append({
-                'team': team,
-                'headline': article['title'],
-                'link': article['link'],
-                'date': article['published'],
-                'source': article['source'],
-                'summary': article['summary']
-            })
+            teams.append(None)
+            headlines.append(article['title'])
+            links.append(article['link'])
+            dates.append(article['published'])
+            sources.append(article['source'])
+            summaries.append(article['summary'])
     
-    # Fetch from team-specific feeds
+    # Fetch from team-specific feeds in one batch; each feed's source name is its team
     team_feeds_dict = RSS_FEED_SOURCES.get('team_feeds', {})
-    for team, feeds in team_feeds_dict.items():
-        if isinstance(feeds, list):
-            team_feed_list = [(url, team) for url in feeds if url]
-            articles = fetcher.fetch_multiple_feeds(team_feed_list, max_workers=APP_SETTINGS.get('max_workers', 10))
-            
-            for article in articles:
-                news_items.append({
-                    'team': team,
-                    'headline': article['title'],
-                    'link': article['link'],
-                    'date': article['published'],
-                    'source': article['source'],
-                    'summary': article['summary']
-                })
+    team_feed_list = [
+        (url, team)
+        for team, feeds in team_feeds_dict.items()
+        if isinstance(feeds, list)
+        for url in feeds if url
+    ]
     
-    if not news_items:
+    if team_feed_list:
+        articles = fetcher.fetch_multiple_feeds(team_feed_list, max_workers=APP_SETTINGS.get('max_workers', 10))
+        
+        for article in articles:
+            teams.append(article['source'])
+            headlines.append(article['title'])
+            links.append(article['link'])
+            dates.append(article['published'])
+            sources.append(article['source'])
+            summaries.append(article['summary'])
+    
+    if not headlines:
         return pd.DataFrame()
     
-    df = pd.DataFrame(news_items)
+    df = pd.DataFrame({
+        'team': teams,
+        'headline': headlines,
+        'link': links,
+        'date': pd.to_datetime(dates),
+        'source': sources,
+        'summary': summaries
+    })
+    
+    untagged = df['team'].isna()
+    if untagged.any():
+        df.loc[untagged, 'team'] = NewsDataProcessor.identify_teams(df.loc[untagged, 'headline'])
+    
     df = NewsDataProcessor.remove_duplicate_articles(df)
+    
+    # Low-cardinality columns as categoricals: int codes instead of one str object per row
+    df['team'] = df['team'].astype('category')
+    df['source'] = df['source'].astype('category')
+    
     df = df.sort_values('date', ascending=False)
     
+    # Rendered columns are built here so they are computed once per fetch, not per rerun
+    df = NewsDataProcessor.add_display_columns(df)
+    
+    # Identifies this cache entry so per-session derived data can be reused until the next fetch
+    df.attrs['fetched_at'] = datetime.now()
+    
     return df
@@ -3,9 +3,48 @@ Odds Fetcher Module
 Handles fetching and processing NFL betting odds from The Odds API
 """
 
+import numpy as np
+import orjson
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive connection pool with light retry/backoff for The Odds API"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# One pool per process, so connections are reused across fetches and sessions
+_HTTP_SESSION = _make_session()
+
+
+class OddsFetchError(Exception):
+    """Raised when the odds request fails or returns an unparseable body"""
+
+
+@lru_cache(maxsize=8)
+def _nfl_week_bounds(ordinal: int) -> Tuple[date, date]:
+    """Thursday-Monday window for the NFL week containing the given day ordinal"""
+    today = date.fromordinal(ordinal)
+    days_until_thursday = (3 - today.weekday()) % 7
+    if days_until_thursday == 0 and today.weekday() != 3:
+        days_until_thursday = 7
+    thursday = today + timedelta(days=days_until_thursday)
+    monday = thursday + timedelta(days=4)
+    return thursday, monday
+
 
 class OddsFetcher:
     """Fetches and processes NFL betting odds"""
@@ -46,15 +85,36 @@ class OddsFetcher:
         "Washington Commanders": "#5A1414",
     }
     
+    # Structured layout of the week's games: the card inputs plus every derived value shown,
+    # filled in vectorized passes by games_to_array once per fetch
+    GAMES_DTYPE = np.dtype([
+        ('a_odds', 'i4'),
+        ('h_odds', 'i4'),
+        ('away_nick', 'O'),
+        ('home_nick', 'O'),
+        ('a_cls', 'U16'),
+        ('h_cls', 'U16'),
+        ('date_str', 'O'),
+        ('book_name', 'O'),
+        ('book_url', 'O'),
+        ('away_odds_str', 'U8'),
+        ('home_odds_str', 'U8'),
+        ('away_implied', 'f8'),
+        ('home_implied', 'f8'),
+        ('away_prob', 'f8'),
+        ('home_prob', 'f8'),
+        ('vig_percent', 'f8'),
+    ])
+    
     # Virginia-legal sportsbooks
-    VA_LEGAL_BOOKS = ["fanduel", "draftkings", "betmgm", "caesars", "bet365"]
+    VA_LEGAL_BOOKS = frozenset({"fanduel", "draftkings", "betmgm", "caesars", "bet365"})
     
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.the-odds-api.com/v4"
     
-    def get_nfl_week_games(self) -> List[Dict]:
-        """Fetch NFL games for the current week (Thursday through Monday)"""
+    def _fetch_events(self) -> List[Dict]:
+        """Download the raw NFL odds events, raising OddsFetchError on any request or JSON error"""
         
         url = f"{self.base_url}/sports/americanfootball_nfl/odds"
         params = {
@@ -65,28 +125,35 @@ class OddsFetcher:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = _HTTP_SESSION.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching odds: {e}")
-            return []
+            raise OddsFetchError(f"Error fetching odds: {e}") from e
         except ValueError as e:
-            print(f"Error parsing JSON: {e}")
+            raise OddsFetchError(f"Error parsing JSON: {e}") from e
+    
+    def get_nfl_week_games(self, today: Optional[date] = None, raise_errors: bool = False) -> List[Dict]:
+        """Fetch NFL games for the week (Thursday through Monday) around today's UTC date"""
+        
+        try:
+            data = self._fetch_events()
+        except OddsFetchError as e:
+            if raise_errors:
+                raise
+            print(e)
             return []
         
-        # Calculate Thursday-Monday window
-        today = datetime.utcnow().date()
-        days_until_thursday = (3 - today.weekday()) % 7
-        if days_until_thursday == 0 and today.weekday() != 3:
-            days_until_thursday = 7
-        thursday = today + timedelta(days=days_until_thursday)
-        monday = thursday + timedelta(days=4)
+        # Thursday-Monday window
+        if today is None:
+            today = datetime.utcnow().date()
+        thursday, monday = _nfl_week_bounds(today.toordinal())
         
         games = []
         for event in data:
             try:
-                start = datetime.fromisoformat(event["commence_time"].replace("Z", "+00:00")).date()
+                # Only the UTC calendar day is needed: "2024-09-08T17:00:00Z" -> 2024-09-08
+                start = date.fromisoformat(event["commence_time"][:10])
             except (KeyError, ValueError) as e:
                 print(f"Error parsing event time: {e}")
                 continue
@@ -113,6 +180,9 @@ class OddsFetcher:
                                 va_odds["home"] = price
                             if name == away and va_odds["away"] is None:
                                 va_odds["away"] = price
+                            
+                            if va_odds["home"] is not None and va_odds["away"] is not None:
+                                break
                         
                         # Store book info
                         if va_odds["home"] is not None and va_odds["away"] is not None:
@@ -123,11 +193,13 @@ class OddsFetcher:
                 if va_odds["home"] is not None and va_odds["away"] is not None:
                     games.append({
                         "away": away,
-                        "a_odds": va_odds["away"],
+                        "away_nick": away.rsplit(" ", 1)[-1],
+                        "a_odds": int(va_odds["away"]),
                         "home": home,
-                        "h_odds": va_odds["home"],
-                        "a_col": self.TEAM_COLORS.get(away, "#666666"),
-                        "h_col": self.TEAM_COLORS.get(home, "#666666"),
+                        "home_nick": home.rsplit(" ", 1)[-1],
+                        "h_odds": int(va_odds["home"]),
+                        "a_cls": self.team_css_class(away),
+                        "h_cls": self.team_css_class(home),
                         "start_time": start,
                         "book_name": va_odds["book_name"],
                         "book_url": va_odds["book_url"]
@@ -138,6 +210,13 @@ class OddsFetcher:
         
         return games
     
+    @staticmethod
+    def team_css_class(team: str) -> str:
+        """CSS class carrying a team's color (rules are generated from TEAM_COLORS)"""
+        if team not in OddsFetcher.TEAM_COLORS:
+            return "tn-default"
+        return "tn-" + team.rsplit(" ", 1)[-1].lower()
+    
     @staticmethod
     def _get_book_url(book_key: str) -> str:
         """Get sportsbook URL"""
@@ -151,6 +230,7 @@ class OddsFetcher:
         return book_urls.get(book_key, "https://www.google.com/search?q=" + book_key)
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def odds_to_implied_prob(odds: int) -> float:
         """Convert American odds to implied probability (includes vig)"""
         if odds > 0:
@@ -161,6 +241,7 @@ class OddsFetcher:
             return abs(odds) / (abs(odds) + 100)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def remove_vig(away_odds: int, home_odds: int) -> tuple:
         """
         Remove vig from odds to get true win probabilities.
@@ -188,8 +269,56 @@ class OddsFetcher:
         return (away_true, home_true)
     
     @staticmethod
+    def games_to_array(games: List[Dict]) -> np.ndarray:
+        """Pack game dicts into a GAMES_DTYPE array with implied/true probabilities, vig and odds strings"""
+        arr = np.zeros(len(games), dtype=OddsFetcher.GAMES_DTYPE)
+        for field in ('a_odds', 'h_odds', 'away_nick', 'home_nick', 'a_cls', 'h_cls'):
+            arr[field] = [g[field] for g in games]
+        arr['date_str'] = [g['start_time'].strftime('%A, %B %d, %Y') for g in games]
+        arr['book_name'] = [g.get('book_name', 'Sportsbook') for g in games]
+        arr['book_url'] = [g.get('book_url', '#') for g in games]
+        
+        # Implied probabilities (with vig), then normalized to 100% to remove it
+        arr['away_implied'] = OddsFetcher.implied_prob_array(arr['a_odds'])
+        arr['home_implied'] = OddsFetcher.implied_prob_array(arr['h_odds'])
+        total = arr['away_implied'] + arr['home_implied']
+        arr['away_prob'] = arr['away_implied'] / total * 100
+        arr['home_prob'] = arr['home_implied'] / total * 100
+        arr['vig_percent'] = (total - 1) * 100
+        
+        arr['away_odds_str'] = OddsFetcher.format_odds_array(arr['a_odds'])
+        arr['home_odds_str'] = OddsFetcher.format_odds_array(arr['h_odds'])
+        return arr
+    
+    @staticmethod
+    def implied_prob_array(odds: np.ndarray) -> np.ndarray:
+        """Vectorized odds_to_implied_prob over an array of American odds"""
+        odds_abs = np.abs(odds)
+        # Underdog: 100 / (odds + 100); favorite: |odds| / (|odds| + 100)
+        return np.where(odds > 0, 100, odds_abs) / (odds_abs + 100)
+    
+    @staticmethod
+    def format_odds_array(odds: np.ndarray) -> np.ndarray:
+        """Vectorized format_odds: American odds as strings with an explicit + sign"""
+        return np.where(odds > 0, np.char.add('+', odds.astype(str)), odds.astype(str))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def format_odds(odds: int) -> str:
         """Format odds with + or - sign"""
         if odds > 0:
             return f"+{odds}"
         return str(odds)
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def fetch_nfl_week_games(api_key: str, today: date) -> np.ndarray:
+    """
+    Fetch the NFL week's games once per UTC calendar day, shared across all sessions.
+    
+    Returns a GAMES_DTYPE array, so the odds math runs once per fetch rather than per rerun.
+    Raises OddsFetchError on failure; st.cache_data does not cache exceptions, so the
+    next run retries instead of serving an empty week for the rest of the day.
+    """
+    games = OddsFetcher(api_key).get_nfl_week_games(today, raise_errors=True)
+    return OddsFetcher.games_to_array(games)
@@ -3,49 +3,163 @@ UI Components Module
 Reusable UI components for the application
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-from typing import Dict, List
+import streamlit.components.v1 as components
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Tuple
 from modules.odds_fetcher import OddsFetcher
 
+# pandas is only needed for annotations here; DataFrames arrive from the news fetcher
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Client-side theme toggle: flips data-theme on the parent page's <html> and remembers
+# the choice in localStorage, so switching themes never triggers a Python rerun
+_THEME_TOGGLE_HTML = """
+<button id="theme-toggle">🌓 Toggle Theme</button>
+<style>
+    body { margin: 0; text-align: right; }
+    #theme-toggle {
+        background: transparent;
+        border: 2px solid #3b82f6;
+        color: #3b82f6;
+        border-radius: 8px;
+        padding: 0.75rem 1.5rem;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+        font-weight: 600;
+        font-size: 0.875rem;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        cursor: pointer;
+    }
+</style>
+<script>
+    const root = window.parent.document.documentElement;
+    const saved = window.parent.localStorage.getItem('nfl-theme');
+    if (saved) {
+        root.dataset.theme = saved;
+    }
+    document.getElementById('theme-toggle').addEventListener('click', () => {
+        root.dataset.theme = root.dataset.theme === 'light' ? 'dark' : 'light';
+        window.parent.localStorage.setItem('nfl-theme', root.dataset.theme);
+    });
+</script>
+"""
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _news_stats(fingerprint: Tuple, _df: pd.DataFrame) -> Tuple[int, int, int]:
+    """Article/team/source counts, computed once per fetched news DataFrame"""
+    teams_covered, sources_count = _df[['team', 'source']].nunique()
+    return len(_df), int(teams_covered), int(sources_count)
+
+_NEWS_ARTICLE_TEMPLATE = """
+    <div class="news-article">
+        <div class="article-header">
+            <span class="article-timestamp">{date_str}</span>
+            <span class="article-team-badge">{team}</span>
+            <span class="article-source">{source}</span>
+        </div>
+        <a href="{link}" target="_blank" class="article-headline">
+            {headline}
+        </a>
+        {summary_html}
+    </div>
+    """
+
+_GAME_CARD_TEMPLATE = """
+    <div class="game-card">
+        <div class="game-header">
+            <div class="game-date">📅 {date_str}</div>
+        </div>
+        <div class="game-teams">
+            <div class="team-section">
+                <div class="team-name {a_cls}">{away_nick}</div>
+                <div class="team-odds">{away_odds_str}</div>
+                <div class="team-prob">{away_prob:.1f}% Win Probability</div>
+            </div>
+            <div class="vs-divider">@</div>
+            <div class="team-section">
+                <div class="team-name {h_cls}">{home_nick}</div>
+                <div class="team-odds">{home_odds_str}</div>
+                <div class="team-prob">{home_prob:.1f}% Win Probability</div>
+            </div>
+        </div>
+        <div style="text-align: center; margin-top: 1.5rem; padding-top: 1rem; border-top: 1px solid var(--border-color);">
+            <div style="font-size: 0.75rem; color: var(--text-secondary); margin-bottom: 0.5rem;">
+                Odds from <a href="{book_url}" target="_blank" style="color: var(--accent-primary); text-decoration: none; font-weight: 600;">{book_name}</a>
+            </div>
+            <div style="font-size: 0.7rem; color: var(--text-secondary); font-style: italic;">
+                Vig: {vig_percent:.2f}% | True probabilities shown above
+            </div>
+        </div>
+    </div>
+    """
+
+def _news_article_html(row: Mapping[str, Any]) -> str:
+    """Build a news article card's HTML from a record of a prepared news frame"""
+    return _NEWS_ARTICLE_TEMPLATE.format_map(row)
+
+def _calculation_details_md(game: np.void) -> str:
+    """Build the step-by-step vig removal breakdown for a game from its precomputed fields"""
+    away_nickname, home_nickname = game['away_nick'], game['home_nick']
+    away_implied, home_implied = game['away_implied'], game['home_implied']
+    total_implied = away_implied + home_implied
+    away_prob, home_prob = game['away_prob'], game['home_prob']
+    
+    return f"""
+    #### {away_nickname} @ {home_nickname}
+    
+    **Odds Input:**
+    - {away_nickname}: {game['away_odds_str']}
+    - {home_nickname}: {game['home_odds_str']}
+    
+    **Step 1: Implied Probabilities (with vig)**
+    - {away_nickname}: {away_implied*100:.2f}%
+    - {home_nickname}: {home_implied*100:.2f}%
+    - Total: {total_implied*100:.2f}% (vig = {game['vig_percent']:.2f}%)
+    
+    **Step 2: Remove Vig (normalize to 100%)**
+    - {away_nickname}: ({away_implied*100:.2f} / {total_implied*100:.2f}) × 100 = {away_prob:.2f}%
+    - {home_nickname}: ({home_implied*100:.2f} / {total_implied*100:.2f}) × 100 = {home_prob:.2f}%
+    - Total: {away_prob + home_prob:.2f}% ✅
+    
+    **Source:** {game['book_name']}
+    """
+
 class UIComponents:
     """Reusable UI components"""
     
     def render_header(self):
         """Render the application header with theme toggle"""
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown("""
-            <div class="app-header">
-                <div class="header-content">
-                    <div>
-                        <div class="app-title">🏈 NFL News & Odds Aggregator</div>
-                        <div class="app-subtitle">Real-Time News & Betting Analysis</div>
-                    </div>
-                </div>
+        st.markdown("""
+        <div class="app-header">
+            <div class="header-content">
                 <div>
-                    <div class="status-indicator">
-                        <div class="status-dot"></div>
-                        LIVE
-                    </div>
+                    <div class="app-title">🏈 NFL News & Odds Aggregator</div>
+                    <div class="app-subtitle">Real-Time News & Betting Analysis</div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            <div>
+                <div class="status-indicator">
+                    <div class="status-dot"></div>
+                    LIVE
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
         
-        with col2:
-            if st.button("🌓 Toggle Theme", use_container_width=True):
-                st.session_state.theme_mode = 'light' if st.session_state.theme_mode == 'dark' else 'dark'
-                st.rerun()
+        # Right-aligned under the full-width header; no column containers needed
+        components.html(_THEME_TOGGLE_HTML, height=60)
     
     def render_news_metrics(self, df: pd.DataFrame):
         """Render metrics dashboard for news"""
         if df.empty:
             return
         
-        total_articles = len(df)
-        teams_covered = df['team'].nunique()
-        sources_count = df['source'].nunique()
+        fingerprint = (len(df), df.attrs.get('fetched_at'))
+        total_articles, teams_covered, sources_count = _news_stats(fingerprint, df)
         
         st.markdown(f"""
         <div class="metrics-grid">
@@ -64,15 +178,15 @@ class UIComponents:
         </div>
         """, unsafe_allow_html=True)
     
-    def render_odds_metrics(self, games: List[Dict]):
-        """Render metrics dashboard for odds"""
-        if not games:
+    def render_odds_metrics(self, games: np.ndarray):
+        """Render metrics dashboard for odds from a GAMES_DTYPE array"""
+        if len(games) == 0:
             return
         
         total_games = len(games)
         
         # Count favorites vs underdogs
-        favorites = sum(1 for g in games if g['h_odds'] < 0 or g['a_odds'] < 0)
+        favorites = int(np.count_nonzero((games['h_odds'] < 0) | (games['a_odds'] < 0)))
         
         st.markdown(f"""
         <div class="metrics-grid">
@@ -87,98 +201,26 @@ class UIComponents:
         </div>
         """, unsafe_allow_html=True)
     
-    def render_news_article(self, row: pd.Series):
-        """Render individual news article card"""
-        date_str = row['date'].strftime('%b %d, %Y %I:%M %p EST')
-        
-        summary_html = f"<div class='article-summary'>{row['summary']}</div>" if row['summary'] else ""
-        
-        st.markdown(f"""
-        <div class="news-article">
-            <div class="article-header">
-                <span class="article-timestamp">{date_str}</span>
-                <span class="article-team-badge">{row['team']}</span>
-                <span class="article-source">{row['source']}</span>
-            </div>
-            <a href="{row['link']}" target="_blank" class="article-headline">
-                {row['headline']}
-            </a>
-            {summary_html}
-        </div>
-        """, unsafe_allow_html=True)
+    def render_news_article(self, row: Mapping[str, Any]):
+        """Render individual news article card from a DataFrame record"""
+        st.markdown(_news_article_html(row), unsafe_allow_html=True)
+    
+    def render_news_articles(self, df: pd.DataFrame):
+        """Render all news article cards in a single markdown element"""
+        st.markdown(
+            "".join(_news_article_html(row) for row in df.to_dict('records')),
+            unsafe_allow_html=True
+        )
     
     def render_game_card(self, game: Dict):
         """Render individual game card with odds"""
-        
-        # Calculate implied probabilities (WITH vig)
-        away_implied = OddsFetcher.odds_to_implied_prob(game['a_odds'])
-        home_implied = OddsFetcher.odds_to_implied_prob(game['h_odds'])
-        total_implied = away_implied + home_implied
-        vig_percent = (total_implied - 1) * 100
-        
-        # Calculate true probabilities (vig removed)
-        away_prob, home_prob = OddsFetcher.remove_vig(game['a_odds'], game['h_odds'])
-        
-        # Format odds
-        away_odds_str = OddsFetcher.format_odds(game['a_odds'])
-        home_odds_str = OddsFetcher.format_odds(game['h_odds'])
-        
-        # Extract team nicknames
-        away_nickname = game['away'].split()[-1]
-        home_nickname = game['home'].split()[-1]
-        
-        # Format date
-        date_str = game['start_time'].strftime('%A, %B %d, %Y')
-        
-        # Sportsbook info
-        book_name = game.get('book_name', 'Sportsbook')
-        book_url = game.get('book_url', '#')
-        
-        st.markdown(f"""
-        <div class="game-card">
-            <div class="game-header">
-                <div class="game-date">📅 {date_str}</div>
-            </div>
-            <div class="game-teams">
-                <div class="team-section">
-                    <div class="team-name" style="color: {game['a_col']}">{away_nickname}</div>
-                    <div class="team-odds">{away_odds_str}</div>
-                    <div class="team-prob">{away_prob:.1f}% Win Probability</div>
-                </div>
-                <div class="vs-divider">@</div>
-                <div class="team-section">
-                    <div class="team-name" style="color: {game['h_col']}">{home_nickname}</div>
-                    <div class="team-odds">{home_odds_str}</div>
-                    <div class="team-prob">{home_prob:.1f}% Win Probability</div>
-                </div>
-            </div>
-            <div style="text-align: center; margin-top: 1.5rem; padding-top: 1rem; border-top: 1px solid var(--border-color);">
-                <div style="font-size: 0.75rem; color: var(--text-secondary); margin-bottom: 0.5rem;">
-                    Odds from <a href="{book_url}" target="_blank" style="color: var(--accent-primary); text-decoration: none; font-weight: 600;">{book_name}</a>
-                </div>
-                <div style="font-size: 0.7rem; color: var(--text-secondary); font-style: italic;">
-                    Vig: {vig_percent:.2f}% | True probabilities shown above
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        self.render_game_cards(OddsFetcher.games_to_array([game]))
+    
+    def render_game_cards(self, games: np.ndarray):
+        """Render all game cards in a single markdown element from a GAMES_DTYPE array"""
+        # Every value shown was computed when the array was built, so this only fills templates
+        st.markdown("".join(_GAME_CARD_TEMPLATE.format_map(game) for game in games), unsafe_allow_html=True)
         
         # Debug expander (optional - remove after verification)
         with st.expander("🔍 Show calculation details"):
-            st.markdown(f"""
-            **Odds Input:**
-            - {away_nickname}: {away_odds_str}
-            - {home_nickname}: {home_odds_str}
-            
-            **Step 1: Implied Probabilities (with vig)**
-            - {away_nickname}: {away_implied*100:.2f}%
-            - {home_nickname}: {home_implied*100:.2f}%
-            - Total: {total_implied*100:.2f}% (vig = {vig_percent:.2f}%)
-            
-            **Step 2: Remove Vig (normalize to 100%)**
-            - {away_nickname}: ({away_implied*100:.2f} / {total_implied*100:.2f}) × 100 = {away_prob:.2f}%
-            - {home_nickname}: ({home_implied*100:.2f} / {total_implied*100:.2f}) × 100 = {home_prob:.2f}%
-            - Total: {away_prob + home_prob:.2f}% ✅
-            
-            **Source:** {book_name}
-            """)
+            st.markdown("\n    ---\n".join(_calculation_details_md(game) for game in games))